@@ -1,42 +1,26 @@
 # app.py
-import matplotlib
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
 import gradio as gr
-import sys
-import io
 from src.WorldGen import WorldAlchemist, WorldConfig
 
 # --- THE GRADIO WRAPPER ---
 def generate_world_view(seed):
-    # 1. Capture Stdout (to show the alchemy report)
-    # We redirect the print statements to a string buffer
-    old_stdout = sys.stdout
-    new_stdout = io.StringIO()
-    sys.stdout = new_stdout
-    
     try:
-        # 2. Run the Simulation
+        # 1. Run the Simulation
         # Ensure seed is an integer
         seed = int(seed)
         sim = WorldAlchemist(seed)
         
-        # 3. Generate the terrain
-        # Note: We need to modify render_slice slightly to return the figure 
-        # instead of saving it, or we just read the saved file.
-        # For this demo, we'll let it save to 'world_gen.png' and read it back.
-        sim.render_slice()
-        
-        # 4. Get the text report
-        output_text = new_stdout.getvalue()
+        # 2. Generate the terrain + the alchemy report
+        # render_slice_fast returns a PIL image, handed to the type="pil"
+        # output as-is: no matplotlib, no file on disk, no re-decode.
+        # The report comes back as text: no sys.stdout swapping, which would
+        # race across Gradio's concurrent requests.
+        image, output_text = sim.render_slice_fast()
         
-        return "world_gen.png", output_text
+        return image, output_text
         
     except Exception as e:
         return None, f"Error: {str(e)}"
-    finally:
-        # Reset stdout
-        sys.stdout = old_stdout
 
 # --- THE INTERFACE ---
 with gr.Blocks(theme=gr.themes.Monochrome()) as demo:
@@ -60,7 +44,7 @@ with gr.Blocks(theme=gr.themes.Monochrome()) as demo:
             )
             
         with gr.Column():
-            output_img = gr.Image(label="Terrain Slice (Flux vs Form)")
+            output_img = gr.Image(label="Terrain Slice (Flux vs Form)", type="pil")
             output_log = gr.Code(label="Alchemy Report", language="markdown")
 
     run_btn.click(fn=generate_world_view, inputs=seed_input, outputs=[output_img, output_log])
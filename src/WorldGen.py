@@ -30,8 +30,16 @@
 
 from dataclasses import dataclass
 from collections import Counter
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+import threading
 import numpy as np
-import matplotlib.pyplot as plt
+from PIL import Image, ImageDraw
+
+try:
+    import numba
+except ImportError:  # optional: pure-Python trial division is the fallback
+    numba = None
 
 # --- THE ELEMENTS (PRIMITIVES) ---
 # We map Primes to Fundamental World Layers
@@ -42,8 +50,163 @@ ELEMENTS = {
     7: {"name": "AETHER", "type": "Magic/Tech", "effect": "Rare Structures"},
     11: {"name": "ENTROPY", "type": "Chaos/Weather", "effect": "Storm Frequency"}
 }
+# Fixed axis for abundance vectors: index i holds the count of _ELEMENT_PRIMES[i]
+_ELEMENT_PRIMES = tuple(ELEMENTS)
+_ELEMENT_INDEX = {p: i for i, p in enumerate(_ELEMENT_PRIMES)}
+
+# --- THE PRIME TABLE (TRIAL DIVISION SUBSTRATE) ---
+# Every prime below 6547 (the first prime past 6542), sieved once at import.
+# Past the table, candidates walk a mod-30 wheel: only residues coprime
+# to 2*3*5 are tried, starting from 6547 (which is 7 mod 30).
+_SMALL_PRIME_LIMIT = 6547
+_WHEEL = (4, 2, 4, 2, 4, 6, 2, 6)
+
+def _sieve(limit):
+    """Sieve of Eratosthenes: all primes strictly below limit."""
+    is_prime = bytearray([1]) * limit
+    is_prime[0:2] = b"\x00\x00"
+    for i in range(2, int(limit ** 0.5) + 1):
+        if is_prime[i]:
+            is_prime[i * i::i] = bytes(len(range(i * i, limit, i)))
+    return tuple(i for i in range(limit) if is_prime[i])
+
+_SMALL_PRIMES = _sieve(_SMALL_PRIME_LIMIT)
+
+# Below 100000 (where most seeds live) no division search is needed at all:
+# a smallest-prime-factor table, sieved once at import (~400 KB), factors
+# any n by repeatedly dividing out _SPF[n].
+_SPF_LIMIT = 100000
+
+def _smallest_prime_factors(limit):
+    """SPF sieve: spf[n] is the least prime dividing n, for 2 <= n < limit."""
+    spf = np.arange(limit, dtype=np.int32)
+    for p in range(2, int(limit ** 0.5) + 1):
+        if spf[p] == p:
+            multiples = spf[p * p::p]
+            np.minimum(multiples, p, out=multiples)
+    return spf
+
+_SPF = _smallest_prime_factors(_SPF_LIMIT)
+_SPF.flags.writeable = False
+
+# --- THE NATIVE KERNEL (OPTIONAL, NUMBA) ---
+# Same table + wheel trial division, compiled to machine code when numba is
+# installed. Works in int64, so it only takes seeds below 2**62 (keeps the
+# i*i probe from overflowing); anything larger stays in Python.
+# Compiled once per process (no on-disk cache): the cache records the module
+# name, so a cache written by `src.WorldGen` breaks `python src/WorldGen.py`.
+# nogil: the kernel touches no Python objects, so concurrent requests (and
+# batch_decompose's worker threads) factor large seeds truly in parallel.
+_NB_LIMIT = 2 ** 62
+_MAX_DISTINCT_PRIMES = 64
+
+def _trial_divide_kernel(n, small_primes, wheel):
+    """Returns (primes, counts) as int64 arrays, ascending."""
+    primes = np.zeros(_MAX_DISTINCT_PRIMES, dtype=np.int64)
+    counts = np.zeros(_MAX_DISTINCT_PRIMES, dtype=np.int64)
+    k = 0
+    exhausted = True
+    for p in small_primes:
+        if p * p > n:
+            exhausted = False
+            break
+        if n % p == 0:
+            c = 0
+            while n % p == 0:
+                n //= p
+                c += 1
+            primes[k] = p
+            counts[k] = c
+            k += 1
+    if exhausted:
+        i = _SMALL_PRIME_LIMIT
+        spoke = 0
+        while i * i <= n:
+            if n % i == 0:
+                c = 0
+                while n % i == 0:
+                    n //= i
+                    c += 1
+                primes[k] = i
+                counts[k] = c
+                k += 1
+            i += wheel[spoke]
+            spoke = (spoke + 1) % len(wheel)
+    if n > 1:
+        primes[k] = n
+        counts[k] = 1
+        k += 1
+    return primes[:k], counts[:k]
+
+if numba is not None:
+    _SMALL_PRIMES_NB = np.array(_SMALL_PRIMES, dtype=np.int64)
+    _WHEEL_NB = np.array(_WHEEL, dtype=np.int64)
+    _trial_divide_nb = numba.njit(nogil=True)(_trial_divide_kernel)
+
+    def _decompose_nb(n):
+        return _trial_divide_nb(n, _SMALL_PRIMES_NB, _WHEEL_NB)
+else:
+    _decompose_nb = None
+
+# --- THE SLICE (SAMPLING GRID) ---
+# Every slice samples the same 100 points over [0, 10]; the grid is built
+# once and frozen so concurrent renders can share it. It is float32: the
+# slice only ever feeds 8-bit pixels, so the terrain math derived from it
+# stays in float32 as well.
+_SLICE_WIDTH = 100
+_X = np.linspace(0, 10, _SLICE_WIDTH, dtype=np.float32)
+_X.flags.writeable = False
+
+# Pillow canvas for render_slice_fast (same 1000x600 frame as the Figure)
+_CANVAS_SIZE = (1000, 600)
+_CANVAS_TITLE_BAND = 60
+_SKY_RGBA = (135, 206, 235, 77)     # skyblue @ 0.3
+_LAND_RGBA = (139, 69, 19, 204)     # #8B4513 @ 0.8
+_WATER_RGBA = (0, 0, 255, 128)      # blue @ 0.5
+_VEG_RGBA = (0, 128, 0, 255)        # green
+
+def _over(rgba, under):
+    """Alpha-composites an RGBA colour over an opaque RGB one."""
+    *rgb, alpha = rgba
+    return tuple(round(c * alpha / 255 + u * (1 - alpha / 255)) for c, u in zip(rgb, under))
+
+# The raster stores one layer code per pixel (bit 0 = land, bit 1 = water,
+# 4 = title band); the palette holds the flat colour of each layer stack.
+_SKY_RGB = _over(_SKY_RGBA, (255, 255, 255))
+_LAND_RGB = _over(_LAND_RGBA, (255, 255, 255))
+_LAYER_PALETTE = (
+    _SKY_RGB
+    + _LAND_RGB
+    + _over(_WATER_RGBA, _SKY_RGB)
+    + _over(_WATER_RGBA, _LAND_RGB)
+    + (255, 255, 255)
+)
+_TITLE_LAYER = 4
+
+# Pixel-column positions on the slice axis, and the canvas row numbers
+_COLUMN_X = np.linspace(0, 10, _CANVAS_SIZE[0], dtype=np.float32)
+_CANVAS_ROWS = np.arange(_CANVAS_SIZE[1])[:, None]
+
+# One Figure for every render_slice: Axes are cleared and redrawn instead of
+# allocating a Figure + canvas per call. Gradio serves requests on a thread
+# pool, so the shared Figure is only ever touched under _FIG_LOCK.
+# matplotlib is imported on first use, straight onto an Agg canvas: importing
+# WorldGen (tests, CLI, the Pillow path) never loads pyplot or a GUI backend.
+_FIG = _AX = None
+_FIG_LOCK = threading.Lock()
+
+def _figure():
+    """The shared (Figure, Axes), built on first call. Hold _FIG_LOCK."""
+    global _FIG, _AX
+    if _FIG is None:
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        fig = Figure(figsize=(10, 6))
+        FigureCanvasAgg(fig)
+        _FIG, _AX = fig, fig.add_subplot()
+    return _FIG, _AX
 
-@dataclass
+@dataclass(frozen=True)
 class WorldConfig:
     sea_level: float
     roughness: float
@@ -52,133 +215,344 @@ class WorldConfig:
     stability_score: float
     biome_name: str
 
+# --- THE ALCHEMY (PURE, MEMOIZED) ---
+# A seed always compiles to the same world, so both stages are cached
+# across requests: repeated seeds (the Examples) become dict lookups.
+# The prime tables above are built once at import and never written again,
+# so every function here is reentrant and safe to call from any thread.
+# Everything here is scalar: stick to builtins and `math`, never `np.*`.
+# NumPy on a Python scalar pays array dispatch and hands back 0-d arrays /
+# numpy scalars that leak into WorldConfig. NumPy belongs to the slice.
+
+@lru_cache(maxsize=4096)
+def _decompose_cached(n):
+    """Breaks the Knowledge Seed into (prime, count) pairs, ascending."""
+    factors = []
+    # 0. Small seeds: read the factorization straight off the SPF table
+    if 1 < n < _SPF_LIMIT:
+        while n > 1:
+            p = int(_SPF[n])
+            factors.append(p)
+            n //= p
+        return tuple(Counter(factors).items())
+
+    # Native path for anything that fits in int64
+    if _decompose_nb is not None and 1 < n < _NB_LIMIT:
+        primes, counts = _decompose_nb(n)
+        return tuple(zip(primes.tolist(), counts.tolist()))
+
+    # 1. Known primes first (the table)
+    for p in _SMALL_PRIMES:
+        if p * p > n:
+            break
+        while n % p == 0:
+            factors.append(p)
+            n //= p
+    else:
+        # 2. Unknown territory: walk the mod-30 wheel
+        i = _SMALL_PRIME_LIMIT
+        spokes = len(_WHEEL)
+        k = 0
+        while i * i <= n:
+            while n % i == 0:
+                factors.append(i)
+                n //= i
+            i += _WHEEL[k]
+            k = (k + 1) % spokes
+    # Whatever survives past sqrt(n) is itself prime
+    if n > 1:
+        factors.append(n)
+    return tuple(Counter(factors).items())
+
+@lru_cache(maxsize=4096)
+def _element_abundances(n):
+    """Projects the seed onto the ELEMENTS axis: (c2, c3, c5, c7, c11)."""
+    abundances = [0] * len(_ELEMENT_PRIMES)
+    for p, count in _decompose_cached(n):
+        if p > _ELEMENT_PRIMES[-1]:
+            break
+        i = _ELEMENT_INDEX.get(p)
+        if i is not None:
+            abundances[i] = count
+    return tuple(abundances)
+
+@lru_cache(maxsize=4096)
+def _stoichiometry(abundances):
+    """
+    Translates an Elemental Abundance vector into World Parameters.
+    This is the Physics Engine.
+    """
+    # 1. Calculate Concentrations (Log scale for balance)
+    # One unpack of the element vector (2, 3, 5, 7, 11); Entropy is unused
+    flux, form, vitality, aether, _entropy = abundances
+
+    # 2. Derive World Parameters
+    # Sea Level: Controlled by Flux vs Form ratio
+    # If Flux > Form, world drowns. If Form > Flux, world dries.
+    total_mass = max(1, flux + form)
+    # 0.5 is equilibrium (Re(s)=1/2)
+    sea_level = 0.5 + (0.05 * (flux - form)) 
+
+    # Roughness: Pure Form makes jagged peaks
+    roughness = 0.1 * form
+
+    # Vegetation: Needs Water (Flux) + Earth (Form) + Life (Vitality)
+    # If you have Life but no Water, it dies.
+    if sea_level < 0.2: # Too dry
+        vegetation = 0.0
+    else:
+        vegetation = 0.1 * vitality * min(flux, form) # Synergy bonus
+
+    # 3. Calculate Stability (The "AllocRatio")
+    # Ideal world is balanced. Deviation from balance = Instability.
+    # Simple heuristic: Deviation from 1:1 Flux/Form ratio
+    balance_ratio = min(flux, form) / max(flux, form) if max(flux, form) > 0 else 0
+    stability = balance_ratio
+
+    # 4. Name the Biome (The Diagnosis)
+    biome = _diagnose_biome(sea_level, vegetation, stability)
+
+    return WorldConfig(sea_level, roughness, vegetation, aether, stability, biome)
+
+# --- THE DIAGNOSIS (BRANCHLESS) ---
+# Each threshold is one bit of a 5-bit index:
+#   16: stable < 0.3   8: sea > 0.8   4: sea < 0.3   2: veg > 5.0   1: veg < 0.5
+# The LUT is filled once by running the priority cascade over all 32 codes,
+# so a diagnosis is a single lookup, and _biome_index works unchanged on
+# ndarrays of (sea, veg, stable) for batch diagnosis.
+def _biome_for_bits(bits):
+    if bits & 16:
+        return "UNSTABLE ISOTOPE (Chaotic Wasteland)"
+    if bits & 8:
+        return "OCEANIC WORLD (Flooded)"
+    if bits & 4:
+        return "ARID DESERT (Drought)"
+    if bits & 2:
+        return "OVERGROWN JUNGLE (Unchecked Growth)"
+    if bits & 1:
+        return "BARREN ROCK (Habitable but Empty)"
+    return "GARDEN OF ECHO (Resonant State)"
+
+_BIOME_LUT = tuple(_biome_for_bits(bits) for bits in range(32))
+
+def _biome_index(sea, veg, stable):
+    return (stable < 0.3) * 16 + (sea > 0.8) * 8 + (sea < 0.3) * 4 + (veg > 5.0) * 2 + (veg < 0.5)
+
+def _diagnose_biome(sea, veg, stable):
+    return _BIOME_LUT[_biome_index(sea, veg, stable)]
+
 class WorldAlchemist:
     def __init__(self, knowledge_seed: int):
         self.seed = knowledge_seed
-        self.factors = self._decompose(knowledge_seed)
+        self.abundances = _element_abundances(knowledge_seed)
         self.config = self._calculate_stoichiometry()
 
+    @property
+    def factors(self):
+        """Full Elemental Composition, rebuilt on demand (reports only)."""
+        return self._decompose(self.seed)
+
     def _decompose(self, n):
         """Breaks the Knowledge Seed into Elemental Abundances"""
-        i = 2
-        factors = []
-        while i * i <= n:
-            while n % i == 0:
-                factors.append(i)
-                n //= i
-            i += 1
-        if n > 1:
-            factors.append(n)
-        return Counter(factors)
+        return Counter(dict(_decompose_cached(n)))
 
     def _calculate_stoichiometry(self):
+        """Looks up (or computes) the World Parameters for these abundances."""
+        return _stoichiometry(self.abundances)
+
+    @staticmethod
+    def batch_decompose(seeds, max_workers=None):
         """
-        Translates Prime Counts into World Parameters.
-        This is the Physics Engine.
+        Full factorizations (Counters) for many seeds, in input order,
+        spread over a thread pool that shares the read-only prime tables.
         """
-        # 1. Calculate Concentrations (Log scale for balance)
-        flux = self.factors.get(2, 0)
-        form = self.factors.get(3, 0)
-        vitality = self.factors.get(5, 0)
-        aether = self.factors.get(7, 0)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            factorizations = list(pool.map(_decompose_cached, map(int, seeds)))
+        return [Counter(dict(factors)) for factors in factorizations]
 
-        # 2. Derive World Parameters
-        # Sea Level: Controlled by Flux vs Form ratio
-        # If Flux > Form, world drowns. If Form > Flux, world dries.
-        total_mass = max(1, flux + form)
-        # 0.5 is equilibrium (Re(s)=1/2)
-        sea_level = 0.5 + (0.05 * (flux - form)) 
+    @staticmethod
+    def batch_configs(seeds):
+        """
+        WorldConfigs for a whole array of seeds at once (gallery mode).
+        Same physics as _stoichiometry, run as array ops over the batch.
+        Seeds must fit in int64.
+        """
+        seeds = np.asarray(seeds, dtype=np.int64).ravel()
+
+        # 1. Elemental Abundances: peel each element prime off every seed
+        # still divisible by it (seeds <= 1 have no factors, as in _decompose)
+        remaining = np.where(seeds > 1, seeds, 1)
+        abundances = np.zeros((len(_ELEMENT_PRIMES), seeds.size), dtype=np.int64)
+        for row, p in enumerate(_ELEMENT_PRIMES):
+            idx = np.flatnonzero(remaining % p == 0)
+            while idx.size:
+                abundances[row, idx] += 1
+                remaining[idx] //= p
+                idx = idx[remaining[idx] % p == 0]
+        flux, form, vitality, aether = abundances[:4]
 
-        # Roughness: Pure Form makes jagged peaks
+        # 2. Derive World Parameters
+        sea_level = 0.5 + (0.05 * (flux - form))
         roughness = 0.1 * form
+        vegetation = np.where(sea_level < 0.2, 0.0, 0.1 * vitality * np.minimum(flux, form))
 
-        # Vegetation: Needs Water (Flux) + Earth (Form) + Life (Vitality)
-        # If you have Life but no Water, it dies.
-        if sea_level < 0.2: # Too dry
-            vegetation = 0.0
-        else:
-            vegetation = 0.1 * vitality * min(flux, form) # Synergy bonus
-
-        # 3. Calculate Stability (The "AllocRatio")
-        # Ideal world is balanced. Deviation from balance = Instability.
-        # Simple heuristic: Deviation from 1:1 Flux/Form ratio
-        balance_ratio = min(flux, form) / max(flux, form) if max(flux, form) > 0 else 0
-        stability = balance_ratio
-
-        # 4. Name the Biome (The Diagnosis)
-        biome = self._diagnose_biome(sea_level, vegetation, stability)
-
-        return WorldConfig(sea_level, roughness, vegetation, aether, stability, biome)
-
-    def _diagnose_biome(self, sea, veg, stable):
-        if stable < 0.3:
-            return "UNSTABLE ISOTOPE (Chaotic Wasteland)"
-        if sea > 0.8:
-            return "OCEANIC WORLD (Flooded)"
-        if sea < 0.3:
-            return "ARID DESERT (Drought)"
-        if veg > 5.0:
-            return "OVERGROWN JUNGLE (Unchecked Growth)"
-        if veg < 0.5:
-            return "BARREN ROCK (Habitable but Empty)"
-        return "GARDEN OF ECHO (Resonant State)"
+        # 3. Stability (balance ratio, 0 when there is neither Flux nor Form)
+        heavier = np.maximum(flux, form)
+        stability = np.divide(np.minimum(flux, form), heavier, out=np.zeros(seeds.size), where=heavier > 0)
 
-    def render_slice(self):
+        # 4. Diagnosis through the biome LUT
+        biomes = [_BIOME_LUT[i] for i in _biome_index(sea_level, vegetation, stability).tolist()]
+
+        return [
+            WorldConfig(*params)
+            for params in zip(sea_level.tolist(), roughness.tolist(), vegetation.tolist(),
+                              aether.tolist(), stability.tolist(), biomes)
+        ]
+
+    def _terrain(self):
         """
-        Visualizes a 1D slice of the world terrain based on stoichiometry.
+        Samples the terrain profile (Form) on the shared grid.
+        Returns (terrain, max_height, water_height).
         """
-        width = 100
-        x = np.linspace(0, 10, width)
-
-        # Generate Terrain (Form)
         # Higher Form = Higher Frequency + Amplitude
-        freq = 1.0 + (self.config.roughness * 0.5)
-        amp = 1.0 + self.config.roughness
-        terrain = np.sin(x * freq) * amp + np.cos(x * freq * 0.5)
+        # terrain = sin(x*freq)*amp + cos(x*freq*0.5), fused in place
+        freq = np.float32(1.0 + (self.config.roughness * 0.5))
+        amp = np.float32(1.0 + self.config.roughness)
+        phase = np.multiply(_X, freq)
+        terrain = np.sin(phase)
+        terrain *= amp
+        np.multiply(phase, 0.5, out=phase)
+        terrain += np.cos(phase, out=phase)
 
         # Shift terrain so 0 is deep, high is mountain
-        terrain = terrain - terrain.min()
+        terrain -= terrain.min()
 
         # Sea Level Cutoff
         max_height = terrain.max()
         water_height = max_height * self.config.sea_level
+        return terrain, max_height, water_height
+
+    def _vegetation(self, terrain, water_height):
+        """Plant positions (veg_x, veg_y) above water, or None if too sparse."""
+        if self.config.vegetation <= 0.5:
+            return None
+        stride = max(1, int(10 / self.config.vegetation)) # More density = smaller step
+        # Plants sit exactly on grid samples, so their height is an index,
+        # not an interpolation search
+        idx = np.arange(0, _SLICE_WIDTH, stride)
+        veg_x = _X[idx]
+        veg_y = terrain[idx]
+        # Only plant above water
+        valid_veg = veg_y >= water_height
+        return veg_x[valid_veg], veg_y[valid_veg]
 
-        # Plotting
-        plt.figure(figsize=(10, 6))
+    def _report(self):
+        """The Alchemy Report, as text (no stdout side effects)."""
+        report_lines = []
+        report_lines.append(f"--- WORLD ALCHEMY REPORT ---")
+        report_lines.append(f"Seed: {self.seed}")
+        report_lines.append(f"Elemental Composition: {dict(self.factors)}")
+        report_lines.append(f" -> Flux (2): {self.abundances[0]}")
+        report_lines.append(f" -> Form (3): {self.abundances[1]}")
+        report_lines.append(f" -> Vitality (5): {self.abundances[2]}")
+        report_lines.append(f"Stability Score: {self.config.stability_score:.2f}")
+        report_lines.append(f"Diagnosis: {self.config.biome_name}")
+        return "\n".join(report_lines)
+
+    def _title(self):
+        return f"World Seed: {self.seed}\nBiome: {self.config.biome_name}\nStability: {self.config.stability_score:.2f}"
+
+    def render_slice(self):
+        """
+        Visualizes a 1D slice of the world terrain based on stoichiometry.
+        Returns (frame, report): an (H, W, 4) uint8 RGBA array and the
+        Alchemy Report text.
+        """
+        x = _X
+        terrain, max_height, water_height = self._terrain()
+
+        plants = self._vegetation(terrain, water_height)
+
+        with _FIG_LOCK:
+            # Plotting (reuse the shared Axes)
+            fig, ax = _figure()
+            ax.clear()
+
+            # Sky
+            ax.fill_between(x, max_height + 2, terrain, color='skyblue', alpha=0.3)
+
+            # Land
+            ax.fill_between(x, terrain, -1, color='#8B4513', alpha=0.8, label='Form (Earth)')
+
+            # Water
+            ax.fill_between(x, water_height, -1, where=(terrain < water_height), color='blue', alpha=0.5, label='Flux (Water)')
+
+            # Vegetation (Points on top of land if conditions met)
+            if plants is not None:
+                ax.scatter(*plants, color='green', marker='^', s=50, label='Vitality (Life)', zorder=10)
+
+            ax.set_title(self._title(), fontsize=14)
+            ax.set_ylim(-1, max_height + 2)
+            ax.legend(loc='upper right')
+            ax.axis('off')
+
+            # Rasterize in memory (no disk round-trip). The canvas buffer is
+            # reused by the next render, so hand back a copy.
+            fig.tight_layout()
+            fig.canvas.draw()
+            image = np.array(fig.canvas.buffer_rgba())
+
+        return image, self._report()
+
+    def render_slice_fast(self):
+        """
+        Same slice as render_slice, rasterized directly with NumPy masks
+        (Pillow only adds markers and text). No matplotlib: the server's
+        hot path.
+        Returns (image, report): a PIL RGB image and the Alchemy Report text.
+        """
+        terrain, max_height, water_height = self._terrain()
+        width, height = _CANVAS_SIZE
+        top = _CANVAS_TITLE_BAND
+        y_min, y_max = -1.0, max_height + 2
 
-        # Sky
-        plt.fill_between(x, max_height + 2, terrain, color='skyblue', alpha=0.3)
+        # Data -> pixel coordinates (y grows downwards)
+        y_scale = (height - 1 - top) / (y_max - y_min)
+        def to_py(y):
+            return top + (y_max - y) * y_scale
 
-        # Land
-        plt.fill_between(x, terrain, -1, color='#8B4513', alpha=0.8, label='Form (Earth)')
+        # Terrain height per pixel column, as a canvas row
+        column_terrain = np.interp(_COLUMN_X, _X, terrain)
+        land = _CANVAS_ROWS >= to_py(column_terrain)
+        water = (_CANVAS_ROWS >= to_py(water_height)) & (column_terrain < water_height)
 
-        # Water
-        plt.fill_between(x, water_height, -1, where=(terrain < water_height), color='blue', alpha=0.5, label='Flux (Water)')
+        # Layer codes -> palette image -> RGB
+        layers = land.view(np.uint8) | (water.view(np.uint8) << 1)
+        layers[:top] = _TITLE_LAYER
+        image = Image.fromarray(layers, "P")
+        image.putpalette(_LAYER_PALETTE)
+        image = image.convert("RGB")
+        draw = ImageDraw.Draw(image, "RGBA")
 
-        # Vegetation (Points on top of land if conditions met)
-        if self.config.vegetation > 0.5:
-            veg_x = x[::int(10/self.config.vegetation)] # More density = smaller step
-            veg_y = np.interp(veg_x, x, terrain)
-            # Only plant above water
-            valid_veg = veg_y >= water_height
-            plt.scatter(veg_x[valid_veg], veg_y[valid_veg], color='green', marker='^', s=50, label='Vitality (Life)', zorder=10)
+        # Vegetation
+        plants = self._vegetation(terrain, water_height)
+        if plants is not None:
+            veg_x, veg_y = plants
+            for px, py in zip((veg_x * ((width - 1) / 10)).tolist(), to_py(veg_y).tolist()):
+                draw.regular_polygon((px, py, 6), 3, fill=_VEG_RGBA)
 
-        plt.title(f"World Seed: {self.seed}\nBiome: {self.config.biome_name}\nStability: {self.config.stability_score:.2f}", fontsize=14)
-        plt.ylim(-1, max_height + 2)
-        plt.legend(loc='upper right')
-        plt.axis('off')
+        draw.multiline_text((width // 2, 8), self._title(), fill="black", anchor="ma", align="center")
 
-        print(f"--- WORLD ALCHEMY REPORT ---")
-        print(f"Seed: {self.seed}")
-        print(f"Elemental Composition: {dict(self.factors)}")
-        print(f" -> Flux (2): {self.factors[2]}")
-        print(f" -> Form (3): {self.factors[3]}")
-        print(f" -> Vitality (5): {self.factors[5]}")
-        print(f"Stability Score: {self.config.stability_score:.2f}")
-        print(f"Diagnosis: {self.config.biome_name}")
+        # Legend
+        legend = [("Form (Earth)", _LAND_RGBA), ("Flux (Water)", _WATER_RGBA)]
+        if plants is not None:
+            legend.append(("Vitality (Life)", _VEG_RGBA))
+        for row, (label, color) in enumerate(legend):
+            y = top + 10 + 18 * row
+            draw.rectangle((width - 120, y, width - 108, y + 12), fill=color)
+            draw.text((width - 102, y), label, fill="black")
 
-        plt.tight_layout()
-        plt.savefig('world_gen.png')
+        return image, self._report()
 
 # --- SIMULATION ---
 
@@ -197,5 +571,7 @@ seed = 29160000
 if __name__ == "__main__":
     print("🎯 Initializing World Alchemist...")
     sim = WorldAlchemist(seed)
-    sim.render_slice()
+    image, report = sim.render_slice()
+    print(report)
+    Image.fromarray(image).save('world_gen.png')
     print("Scale invariant: World generated at 1/2 equilibrium 🫠")
\ No newline at end of file